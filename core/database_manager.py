@@ -8,6 +8,7 @@ import json
 import time
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any
+from functools import lru_cache
 from dataclasses import asdict
 import numpy as np
 from supabase import create_client, Client
@@ -554,22 +555,25 @@ class DatabaseManager:
                     'profit_factor': 0
                 }
             
-            # Calculate metrics
-            total_trades = len(trades)
-            winning_trades = len([t for t in trades if t['pnl'] > 0])
-            losing_trades = len([t for t in trades if t['pnl'] < 0])
-            total_pnl = sum(t['pnl'] for t in trades)
+            # Calculate metrics with array reductions over a single P&L vector
+            pnls = np.fromiter((t['pnl'] for t in trades), dtype=float, count=len(trades))
+            wins = pnls > 0
+            losses = pnls < 0
+            
+            total_trades = len(pnls)
+            winning_trades = int(wins.sum())
+            losing_trades = int(losses.sum())
+            total_pnl = float(pnls.sum())
             
             win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
             avg_pnl = total_pnl / total_trades if total_trades > 0 else 0
             
-            pnls = [t['pnl'] for t in trades]
-            best_trade = max(pnls) if pnls else 0
-            worst_trade = min(pnls) if pnls else 0
+            best_trade = float(pnls.max())
+            worst_trade = float(pnls.min())
             
             # Profit factor
-            gross_profit = sum(pnl for pnl in pnls if pnl > 0)
-            gross_loss = abs(sum(pnl for pnl in pnls if pnl < 0))
+            gross_profit = float(pnls[wins].sum())
+            gross_loss = abs(float(pnls[losses].sum()))
             profit_factor = gross_profit / gross_loss if gross_loss > 0 else 0
             
             return {
@@ -650,4 +654,16 @@ class DatabaseManager:
         except Exception as e:
             logger.error(f"Error calculating live DB metrics: {e}")
             
-        return metrics
\ No newline at end of file
+        return metrics
+
+
+@lru_cache(maxsize=1)
+def get_database_manager() -> DatabaseManager:
+    """
+    Get the shared DatabaseManager instance
+    
+    Every DatabaseManager() builds a new Supabase client and HTTP connection pool,
+    so request handlers and config lookups should reuse this one instead.
+    A failed connection is not cached and will be retried on the next call.
+    """
+    return DatabaseManager()
@@ -37,7 +37,7 @@ def with_api_retry(max_retries=3, delay=1.0, backoff=2.0, exceptions=(Exception,
                 try:
                     # Add rate limiting for API calls
                     if hasattr(self, 'last_api_call') and hasattr(self, 'api_call_delay'):
-                        time_since_last = time.time() - self.last_api_call
+                        time_since_last = time.monotonic() - self.last_api_call
                         if time_since_last < self.api_call_delay:
                             time.sleep(self.api_call_delay - time_since_last)
                     
@@ -45,7 +45,7 @@ def with_api_retry(max_retries=3, delay=1.0, backoff=2.0, exceptions=(Exception,
                     
                     # Update last API call time
                     if hasattr(self, 'last_api_call'):
-                        self.last_api_call = time.time()
+                        self.last_api_call = time.monotonic()
                     
                     return result
                     
@@ -94,6 +94,7 @@ class KiteManager:
         # Rate limiting to prevent "Too many requests"
         self.last_api_call = 0
         self.api_call_delay = 0.2  # 200ms between calls
+        self.quote_batch_size = 500  # Kite quote() accepts up to 500 instruments per call
         self.is_authenticated = False
         
         # Load existing access token if available
@@ -102,6 +103,8 @@ class KiteManager:
         # Market instruments cache
         self.instruments = {}
         self.nifty_instruments = {}
+        self._options_by_strike_cache = {}  # expiry date -> {strike: {'CE': ..., 'PE': ...}}
+        self._nearest_expiry_cache = None   # (trading date, nearest expiry 'YYYY-MM-DD')
         
         logger.info("🔌 KiteManager initialized")
     
@@ -121,12 +124,12 @@ class KiteManager:
     
     def _rate_limit(self):
         """Enforce rate limiting between API calls to prevent 'Too many requests'"""
-        current_time = time.time()
+        current_time = time.monotonic()
         time_since_last = current_time - self.last_api_call
         if time_since_last < self.api_call_delay:
             sleep_time = self.api_call_delay - time_since_last
             time.sleep(sleep_time)
-        self.last_api_call = time.time()
+        self.last_api_call = time.monotonic()
         
     def _load_access_token(self):
         """Load access token from file if exists"""
@@ -312,6 +315,10 @@ class KiteManager:
                    inst.get('segment') == 'NFO-OPT'
             }
             
+            # Strike indexes and nearest expiry were built from the previous instrument dump
+            self._options_by_strike_cache = {}
+            self._nearest_expiry_cache = None
+            
             logger.info(f"Loaded {len(self.instruments)} instruments, {len(self.nifty_instruments)} Nifty options")
             return True
             
@@ -401,126 +408,114 @@ class KiteManager:
             # Convert expiry to the format used in Kite instruments
             expiry_date = datetime.strptime(expiry, '%Y-%m-%d')
             
+            # Group this expiry's options by strike once instead of rescanning all instruments per strike
+            options_by_strike = self._index_options_by_strike(expiry_date.date())
+            
+            # Helper function to safely extract bid/ask from depth
+            def extract_bid_ask(quote_dict):
+                bid_price = 0
+                ask_price = 0
+                
+                try:
+                    depth = quote_dict.get('depth', {})
+                    if isinstance(depth, dict):
+                        # Extract bid price
+                        buy_orders = depth.get('buy', [])
+                        if isinstance(buy_orders, list) and len(buy_orders) > 0:
+                            first_buy = buy_orders[0]
+                            if isinstance(first_buy, dict):
+                                bid_price = first_buy.get('price', 0)
+                        
+                        # Extract ask price
+                        sell_orders = depth.get('sell', [])
+                        if isinstance(sell_orders, list) and len(sell_orders) > 0:
+                            first_sell = sell_orders[0]
+                            if isinstance(first_sell, dict):
+                                ask_price = first_sell.get('price', 0)
+                except Exception:
+                    pass  # Return 0 values if extraction fails
+                
+                return bid_price, ask_price
+            
+            # Helper function to safely extract data from quote
+            def extract_quote_data(quote_dict):
+                if not isinstance(quote_dict, dict):
+                    return {
+                        'last_price': 0,
+                        'open_interest': 0,
+                        'volume': 0,
+                        'bid': 0,
+                        'ask': 0,
+                        'change': 0,
+                        'change_percent': 0
+                    }
+                
+                bid_price, ask_price = extract_bid_ask(quote_dict)
+                
+                return {
+                    'last_price': quote_dict.get('last_price', 0),
+                    'open_interest': quote_dict.get('oi', 0),
+                    'volume': quote_dict.get('volume', 0),
+                    'bid': bid_price,
+                    'ask': ask_price,
+                    'change': quote_dict.get('net_change', 0),
+                    'change_percent': quote_dict.get('net_change_percent', 0)
+                }
+            
+            # Find CE and PE instruments for each strike first, so every quote
+            # can be fetched in one batched call instead of one rate-limited call per strike
+            strike_pairs = []
             for strike in strikes:
+                strike_options = options_by_strike.get(strike, {})
+                ce_instrument = strike_options.get('CE')
+                pe_instrument = strike_options.get('PE')
+                
+                if ce_instrument and pe_instrument:
+                    strike_pairs.append((strike, ce_instrument, pe_instrument))
+            
+            tokens = []
+            for _, ce_instrument, pe_instrument in strike_pairs:
+                tokens.append(str(ce_instrument['instrument_token']))
+                tokens.append(str(pe_instrument['instrument_token']))
+            
+            try:
+                # Fetch complete quote data (includes OI, Volume, Bid, Ask, LTP)
+                market_data = self._batched_api_call(self.kite.quote, tokens)
+                has_full_quotes = True
+            except Exception as quote_error:
+                logger.warning(f"⚠️ Quote API error for option chain: {quote_error}, falling back to LTP")
+                market_data = self._batched_api_call(self.kite.ltp, tokens)
+                has_full_quotes = False
+            
+            for strike, ce_instrument, pe_instrument in strike_pairs:
                 try:
-                    # Find CE and PE instruments for this strike and expiry
-                    ce_instrument = None
-                    pe_instrument = None
+                    ce_raw = market_data.get(str(ce_instrument['instrument_token']), {})
+                    pe_raw = market_data.get(str(pe_instrument['instrument_token']), {})
                     
-                    # Search through instruments for matching options
-                    for symbol_key, instrument in self.instruments.items():
-                        if (instrument.get('name') == 'NIFTY' and 
-                            instrument.get('segment') == 'NFO-OPT' and
-                            instrument.get('strike') == strike and
-                            instrument.get('expiry') and
-                            instrument['expiry'] == expiry_date.date()):
-                            
-                            if instrument.get('instrument_type') == 'CE':
-                                ce_instrument = instrument
-                            elif instrument.get('instrument_type') == 'PE':
-                                pe_instrument = instrument
+                    if has_full_quotes:
+                        # Extract complete market data for CE and PE
+                        ce_data = extract_quote_data(ce_raw)
+                        pe_data = extract_quote_data(pe_raw)
+                    else:
+                        ce_data = {
+                            'last_price': ce_raw.get('last_price', 0),
+                            'open_interest': 0, 'volume': 0, 'bid': 0, 'ask': 0, 'change': 0, 'change_percent': 0
+                        }
+                        pe_data = {
+                            'last_price': pe_raw.get('last_price', 0),
+                            'open_interest': 0, 'volume': 0, 'bid': 0, 'ask': 0, 'change': 0, 'change_percent': 0
+                        }
+                    
+                    option_chain.append({
+                        'strike': strike,
+                        'ce_symbol': ce_instrument.get('tradingsymbol', f'NIFTY{strike}CE'),
+                        'ce_data': ce_data,
+                        'ce_token': ce_instrument['instrument_token'],
+                        'pe_symbol': pe_instrument.get('tradingsymbol', f'NIFTY{strike}PE'),
+                        'pe_data': pe_data,
+                        'pe_token': pe_instrument['instrument_token']
+                    })
                     
-                    if ce_instrument and pe_instrument:
-                        # Get complete market data for both options using quote()
-                        ce_token = str(ce_instrument['instrument_token'])
-                        pe_token = str(pe_instrument['instrument_token'])
-                        
-                        try:
-                            # Rate limit API call to prevent "Too many requests"
-                            self._rate_limit()
-                            
-                            # Fetch complete quote data (includes OI, Volume, Bid, Ask, LTP)
-                            quote_data = self.kite.quote([ce_token, pe_token])
-                            
-                            # Helper function to safely extract bid/ask from depth
-                            def extract_bid_ask(quote_dict):
-                                bid_price = 0
-                                ask_price = 0
-                                
-                                try:
-                                    depth = quote_dict.get('depth', {})
-                                    if isinstance(depth, dict):
-                                        # Extract bid price
-                                        buy_orders = depth.get('buy', [])
-                                        if isinstance(buy_orders, list) and len(buy_orders) > 0:
-                                            first_buy = buy_orders[0]
-                                            if isinstance(first_buy, dict):
-                                                bid_price = first_buy.get('price', 0)
-                                        
-                                        # Extract ask price
-                                        sell_orders = depth.get('sell', [])
-                                        if isinstance(sell_orders, list) and len(sell_orders) > 0:
-                                            first_sell = sell_orders[0]
-                                            if isinstance(first_sell, dict):
-                                                ask_price = first_sell.get('price', 0)
-                                except Exception:
-                                    pass  # Return 0 values if extraction fails
-                                
-                                return bid_price, ask_price
-                            
-                            # Helper function to safely extract data from quote
-                            def extract_quote_data(quote_dict):
-                                if not isinstance(quote_dict, dict):
-                                    return {
-                                        'last_price': 0,
-                                        'open_interest': 0,
-                                        'volume': 0,
-                                        'bid': 0,
-                                        'ask': 0,
-                                        'change': 0,
-                                        'change_percent': 0
-                                    }
-                                
-                                bid_price, ask_price = extract_bid_ask(quote_dict)
-                                
-                                return {
-                                    'last_price': quote_dict.get('last_price', 0),
-                                    'open_interest': quote_dict.get('oi', 0),
-                                    'volume': quote_dict.get('volume', 0),
-                                    'bid': bid_price,
-                                    'ask': ask_price,
-                                    'change': quote_dict.get('net_change', 0),
-                                    'change_percent': quote_dict.get('net_change_percent', 0)
-                                }
-                            
-                            # Extract complete market data for CE
-                            ce_quote_raw = quote_data.get(ce_token, {}) if isinstance(quote_data, dict) else {}
-                            ce_data = extract_quote_data(ce_quote_raw)
-                            
-                            # Extract complete market data for PE
-                            pe_quote_raw = quote_data.get(pe_token, {}) if isinstance(quote_data, dict) else {}
-                            pe_data = extract_quote_data(pe_quote_raw)
-                            
-                        except Exception as quote_error:
-                            logger.warning(f"⚠️ Quote API error for strike {strike}: {quote_error}, falling back to LTP")
-                            # Rate limit fallback call
-                            self._rate_limit()
-                            
-                            # Fallback to LTP if quote fails
-                            ltp_data = self.kite.ltp([ce_token, pe_token])
-                            
-                            ce_ltp_data = ltp_data.get(ce_token, {}) if isinstance(ltp_data, dict) else {}
-                            pe_ltp_data = ltp_data.get(pe_token, {}) if isinstance(ltp_data, dict) else {}
-                            
-                            ce_data = {
-                                'last_price': ce_ltp_data.get('last_price', 0),
-                                'open_interest': 0, 'volume': 0, 'bid': 0, 'ask': 0, 'change': 0, 'change_percent': 0
-                            }
-                            pe_data = {
-                                'last_price': pe_ltp_data.get('last_price', 0),
-                                'open_interest': 0, 'volume': 0, 'bid': 0, 'ask': 0, 'change': 0, 'change_percent': 0
-                            }
-                        
-                        option_chain.append({
-                            'strike': strike,
-                            'ce_symbol': ce_instrument.get('tradingsymbol', f'NIFTY{strike}CE'),
-                            'ce_data': ce_data,
-                            'ce_token': ce_instrument['instrument_token'],
-                            'pe_symbol': pe_instrument.get('tradingsymbol', f'NIFTY{strike}PE'),
-                            'pe_data': pe_data,
-                            'pe_token': pe_instrument['instrument_token']
-                        })
-                        
                 except Exception as e:
                     logger.warning(f"⚠️ Error processing strike {strike}: {e}")
                     continue
@@ -532,6 +527,51 @@ class KiteManager:
             logger.error(f"Error getting option chain: {e}")
             return []
     
+    def _batched_api_call(self, api_method, instruments: List[str]) -> Dict[str, Any]:
+        """
+        Call a multi-instrument Kite API (quote/ltp) in as few rate-limited requests as possible
+        
+        Args:
+            api_method: Bound KiteConnect method taking a list of instruments
+            instruments: Instrument tokens or EXCHANGE:SYMBOL keys
+            
+        Returns:
+            Merged response keyed by instrument
+        """
+        results = {}
+        for i in range(0, len(instruments), self.quote_batch_size):
+            # Rate limit API call to prevent "Too many requests"
+            self._rate_limit()
+            batch_data = api_method(instruments[i:i + self.quote_batch_size])
+            if isinstance(batch_data, dict):
+                results.update(batch_data)
+        return results
+    
+    def _index_options_by_strike(self, expiry_date) -> Dict[float, Dict[str, Dict]]:
+        """Group cached NIFTY options for one expiry as {strike: {'CE': instrument, 'PE': instrument}}"""
+        # Reuse the index built by an earlier chain fetch or strike lookup for this expiry
+        cached_index = self._options_by_strike_cache.get(expiry_date)
+        if cached_index is not None:
+            return cached_index
+        
+        options_by_strike: Dict[float, Dict[str, Dict]] = {}
+        
+        # nifty_instruments is the pre-filtered NIFTY option subset built by load_instruments()
+        for instrument in (self.nifty_instruments or self.instruments).values():
+            if (instrument.get('name') == 'NIFTY' and
+                instrument.get('segment') == 'NFO-OPT' and
+                instrument.get('expiry') == expiry_date):
+                
+                option_type = instrument.get('instrument_type')
+                if option_type in ('CE', 'PE'):
+                    options_by_strike.setdefault(instrument.get('strike'), {})[option_type] = instrument
+        
+        # Only cache once instruments are loaded so an empty result is retried later
+        if self.instruments:
+            self._options_by_strike_cache[expiry_date] = options_by_strike
+        
+        return options_by_strike
+    
     def get_option_by_strike(self, strike: int, option_type: str, expiry: Optional[str] = None) -> Optional[Dict]:
         """Fast lookup of option from cached instruments without API calls
         
@@ -555,29 +595,24 @@ class KiteManager:
         try:
             expiry_date = datetime.strptime(expiry, '%Y-%m-%d').date()
             
-            # Search cached instruments
-            for symbol_key, instrument in self.instruments.items():
-                if (instrument.get('name') == 'NIFTY' and
-                    instrument.get('segment') == 'NFO-OPT' and
-                    instrument.get('strike') == strike and
-                    instrument.get('instrument_type') == option_type and
-                    instrument.get('expiry') == expiry_date):
-                    
-                    # Get LTP from quote API
-                    token = str(instrument['instrument_token'])
-                    self._rate_limit()
-                    ltp_data = self.kite.ltp([token])
-                    last_price = 0.0
-                    if isinstance(ltp_data, dict) and token in ltp_data:
-                        token_data = ltp_data[token]
-                        if isinstance(token_data, dict):
-                            last_price = float(token_data.get('last_price', 0))
-                    
-                    return {
-                        'tradingsymbol': instrument['tradingsymbol'],
-                        'instrument_token': instrument['instrument_token'],
-                        'last_price': last_price
-                    }
+            # Look up the strike in the cached per-expiry index
+            instrument = self._index_options_by_strike(expiry_date).get(strike, {}).get(option_type)
+            if instrument:
+                # Get LTP from quote API
+                token = str(instrument['instrument_token'])
+                self._rate_limit()
+                ltp_data = self.kite.ltp([token])
+                last_price = 0.0
+                if isinstance(ltp_data, dict) and token in ltp_data:
+                    token_data = ltp_data[token]
+                    if isinstance(token_data, dict):
+                        last_price = float(token_data.get('last_price', 0))
+                
+                return {
+                    'tradingsymbol': instrument['tradingsymbol'],
+                    'instrument_token': instrument['instrument_token'],
+                    'last_price': last_price
+                }
             
             return None
             
@@ -588,9 +623,14 @@ class KiteManager:
     def _get_nearest_real_expiry(self) -> Optional[str]:
         """Get nearest expiry date from real Kite Connect instruments"""
         try:
-            expiry_dates = set()
+            nearest_expiry = None
             current_date = datetime.now().date()
             
+            # The nearest expiry only changes with the date or an instrument reload,
+            # so skip rescanning the full instrument dump on repeat calls today
+            if self._nearest_expiry_cache and self._nearest_expiry_cache[0] == current_date:
+                return self._nearest_expiry_cache[1]
+            
             # Extract expiry dates from NIFTY option instruments
             for symbol_key, instrument in self.instruments.items():
                 if (instrument.get('name') == 'NIFTY' and 
@@ -605,15 +645,18 @@ class KiteManager:
                     else:
                         expiry_date = expiry
                     
-                    if expiry_date >= current_date:  # Only future expiries
-                        expiry_dates.add(expiry_date.strftime('%Y-%m-%d'))
+                    # Track the nearest future expiry directly instead of collecting and sorting all of them
+                    if expiry_date >= current_date and (nearest_expiry is None or expiry_date < nearest_expiry):
+                        nearest_expiry = expiry_date
             
-            if not expiry_dates:
+            if nearest_expiry is None:
                 logger.warning("⚠️ No future expiry dates found in instruments")
                 return None
                 
             # Return the nearest future expiry
-            return sorted(list(expiry_dates))[0]
+            nearest_expiry_str = nearest_expiry.strftime('%Y-%m-%d')
+            self._nearest_expiry_cache = (current_date, nearest_expiry_str)
+            return nearest_expiry_str
             
         except Exception as e:
             logger.error(f"❌ Error getting nearest real expiry: {e}")
@@ -10,12 +10,12 @@ Provides:
 4. Market status and trading hours validation
 """
 
+import time
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 import pytz
-from kiteconnect import KiteConnect
 
 from core.kite_manager import KiteManager
 
@@ -37,6 +37,11 @@ class MarketDataManager:
         self.option_chain = {}
         self.current_prices = {}
         
+        # Short-lived NIFTY 50 quote shared by market status and spot price lookups
+        self.quote_cache_ttl = 1.0  # seconds
+        self._nifty_quote = None
+        self._nifty_quote_time = 0.0
+        
         # IST timezone
         self.ist = pytz.timezone('Asia/Kolkata')
         
@@ -60,10 +65,9 @@ class MarketDataManager:
         try:
             if self.kite and hasattr(self.kite, 'quote'):
                 # Try to get a quote - market closed returns specific error
-                response = self.kite.quote(["NSE:NIFTY 50"])
-                if response and "NSE:NIFTY 50" in response:
+                quote_data = self._get_nifty_quote()
+                if quote_data:
                     # If we get valid quote data, market is likely open
-                    quote_data = response["NSE:NIFTY 50"]
                     # Check if last price timestamp is recent (within 5 minutes)
                     if "last_trade_time" in quote_data:
                         import dateutil.parser
@@ -78,6 +82,26 @@ class MarketDataManager:
         
         return None  # API check inconclusive
     
+    def _get_nifty_quote(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the NSE:NIFTY 50 quote, reusing a response younger than quote_cache_ttl
+        
+        The trading loop checks market status and then spot price every iteration
+        (and the dashboard polls the same pair), so without this each cycle makes
+        identical quote calls back to back.
+        """
+        now = time.monotonic()
+        if self._nifty_quote is not None and now - self._nifty_quote_time < self.quote_cache_ttl:
+            return self._nifty_quote
+        
+        response = self.kite.quote(["NSE:NIFTY 50"])
+        quote_data = response.get("NSE:NIFTY 50") if response else None
+        if quote_data:
+            self._nifty_quote = quote_data
+            self._nifty_quote_time = now
+        
+        return quote_data
+    
     def _local_market_hours_check(self) -> bool:
         """Fallback local time-based market hours validation"""
         try:
@@ -181,9 +205,9 @@ class MarketDataManager:
             
             if symbol is None:
                 # Get Nifty spot price
-                quote = self.kite.quote([f"NSE:NIFTY 50"])
-                if f"NSE:NIFTY 50" in quote:
-                    return float(quote[f"NSE:NIFTY 50"]["last_price"])
+                quote_data = self._get_nifty_quote()
+                if quote_data:
+                    return float(quote_data["last_price"])
             else:
                 # Get option price
                 instrument_token = self._get_option_token(symbol)
@@ -313,7 +337,8 @@ class MarketDataManager:
                     
                     # Calculate simple volatility (based on recent price movements)
                     if len(self.ohlcv_data) >= 20:
-                        recent_returns = self.ohlcv_data['close'].pct_change().tail(20)
+                        # Only the last 20 returns are needed - slice before pct_change, not after
+                        recent_returns = self.ohlcv_data['close'].tail(21).pct_change()
                         volatility = recent_returns.std() * np.sqrt(252) * 100  # Annualized
                         data['volatility'] = round(volatility, 2)
             
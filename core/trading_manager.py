@@ -31,7 +31,7 @@ from core.kite_manager import KiteManager
 from core.market_data_manager import MarketDataManager
 from core.virtual_order_executor import VirtualOrderExecutor
 from core.live_order_executor import LiveOrderExecutor
-from core.database_manager import DatabaseManager
+from core.database_manager import get_database_manager
 from strategies import ScalpingStrategy, ScalpingConfig, BaseStrategy
 
 # Set up logging
@@ -55,7 +55,7 @@ class TradingManager:
         
         # Initialize database first (will be None if credentials not available)
         try:
-            self.db_manager = DatabaseManager()
+            self.db_manager = get_database_manager()
             print("Database connected successfully")
         except Exception as e:
             print(f"Database connection failed: {e}")
@@ -190,8 +190,9 @@ class TradingManager:
             # Mark session start time and save initial state
             self._session_start_time = datetime.now(self.ist).isoformat()
             
-            # Update monitoring
+            # Update monitoring (monotonic copy avoids re-parsing the ISO string every health check)
             self.monitoring['session_start_time'] = self._session_start_time
+            self._session_start_monotonic = time.monotonic()
             self.monitoring['strategies_activated'] += len(self.active_strategies)
             self._log_system_event("TRADING_START", 
                                  f"Trading started with {len(self.active_strategies)} strategies", 
@@ -416,6 +417,7 @@ class TradingManager:
             'connection_recoveries': 0,
             'orders_executed': 0
         }
+        self._session_start_monotonic = None
         
         # Create monitoring log file
         log_dir = os.path.join('logs')
@@ -464,9 +466,8 @@ class TradingManager:
             alerts.append("No active strategies for extended period")
         
         # Alert 4: Session duration monitoring
-        if self.monitoring['session_start_time']:
-            session_duration = (datetime.now(self.ist) - 
-                              datetime.fromisoformat(self.monitoring['session_start_time'])).total_seconds()
+        if self._session_start_monotonic is not None:
+            session_duration = time.monotonic() - self._session_start_monotonic
             if session_duration > 8 * 3600:  # 8 hours
                 alerts.append(f"Long session duration: {session_duration/3600:.1f} hours")
         
@@ -566,8 +567,8 @@ class TradingManager:
                         
                         self._process_strategy(strategy_name)
                 
-                # Monitor existing positions
-                self._monitor_positions()
+                # Monitor existing positions (returns the option LTPs it fetched)
+                position_prices = self._monitor_positions()
                 
                 # Check 5% Target Profit Threshold after a position closes
                 current_open_positions = len(self.order_executor.positions)
@@ -593,7 +594,7 @@ class TradingManager:
                 
                 # Update daily P&L periodically (every 60 iterations = ~1 minute)
                 if int(time.time()) % 60 == 0:
-                    self._update_daily_pnl()
+                    self._update_daily_pnl(position_prices)
                 
                 # Auto-save strategy states periodically
                 self._auto_save_states()
@@ -625,7 +626,7 @@ class TradingManager:
             minute_data = self.market_data.get_nifty_ohlcv(interval="minute", days=1)
             
             # Throttle 5-min fetches (every 15 seconds safely)
-            current_time = time.time()
+            current_time = time.monotonic()
             if not hasattr(self, '_last_5m_fetch_time'):
                 self._last_5m_fetch_time = 0
             
@@ -723,18 +724,52 @@ class TradingManager:
             
             if ltp_data and nfo_symbol in ltp_data:
                 last_price = ltp_data[nfo_symbol].get('last_price', 0.0)
-                print(f"✅ Got LTP for {base_symbol}: ₹{last_price} (from key: {symbol})")
+                # Runs per open position on every loop tick - keep it lazy and at DEBUG
+                logger.debug("Got LTP for %s: %s (from key: %s)", base_symbol, last_price, symbol)
                 return float(last_price)
             else:
-                logger.warning(f"No LTP data available for {base_symbol} (position key: {symbol})")
+                logger.warning("No LTP data available for %s (position key: %s)", base_symbol, symbol)
                 return 0.0
             
         except Exception as e:
             logger.error(f"Error getting real option price for {symbol}: {e}")
             return 0.0
     
-    def _monitor_positions(self):
-        """Monitor existing positions for exit conditions and update live prices"""
+    def _get_option_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        Get real option prices for several positions with a single Kite LTP request
+        
+        Args:
+            symbols: Position symbols (may carry a unique '_suffix' after the tradingsymbol)
+            
+        Returns:
+            Dictionary of symbol -> LTP (0.0 when no price is available)
+        """
+        try:
+            # Same base-symbol extraction as _get_option_price
+            nfo_symbols = {symbol: f"NFO:{symbol.split('_')[0]}" for symbol in symbols}
+            ltp_data = self.kite_manager.ltp(list(set(nfo_symbols.values()))) if nfo_symbols else {}
+            
+            prices = {}
+            for symbol, nfo_symbol in nfo_symbols.items():
+                if ltp_data and nfo_symbol in ltp_data:
+                    prices[symbol] = float(ltp_data[nfo_symbol].get('last_price', 0.0))
+                else:
+                    logger.warning("No LTP data available for %s (position key: %s)", nfo_symbol[4:], symbol)
+                    prices[symbol] = 0.0
+            return prices
+            
+        except Exception as e:
+            logger.error(f"Error getting real option prices for {symbols}: {e}")
+            return {symbol: 0.0 for symbol in symbols}
+    
+    def _monitor_positions(self) -> Optional[Dict[str, float]]:
+        """
+        Monitor existing positions for exit conditions and update live prices
+        
+        Returns:
+            Dictionary of symbol -> LTP fetched for open positions (None if nothing was checked)
+        """
         try:
             # Get all open positions from database
             if not self.db_manager:
@@ -750,11 +785,14 @@ class TradingManager:
             symbol_prices = {}
             positions_to_close = []
             
+            # One batched LTP request for every open position instead of one per position
+            option_prices = self._get_option_prices([p['symbol'] for p in open_positions])
+            
             for db_position in open_positions:
                 symbol = db_position['symbol']
                 
                 # Get current option price
-                current_price = self._get_option_price(symbol)
+                current_price = option_prices.get(symbol, 0.0)
                 if current_price <= 0:
                     continue
                     
@@ -864,6 +902,8 @@ class TradingManager:
                 except Exception as e:
                     print(f"Error updating position in database: {e}")
             
+            return symbol_prices
+            
         except Exception as e:
             print(f"Error monitoring positions: {e}")
     
@@ -1195,7 +1235,7 @@ class TradingManager:
         except Exception as e:
             print(f"Error saving strategy signal to database: {e}")
     
-    def _update_daily_pnl(self):
+    def _update_daily_pnl(self, position_prices: Optional[Dict[str, float]] = None):
         """Update daily P&L summary"""
         if not self.db_manager:
             return
@@ -1223,7 +1263,8 @@ class TradingManager:
                 is_open=True
             )
             for pos in positions:
-                current_price = self._get_option_price(pos['symbol'])
+                # Reuse the LTP _monitor_positions fetched earlier in this loop iteration
+                current_price = (position_prices or {}).get(pos['symbol']) or self._get_option_price(pos['symbol'])
                 if current_price > 0:
                     unrealized_pnl += (current_price - pos['average_price']) * pos['quantity']
             
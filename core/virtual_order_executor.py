@@ -12,9 +12,10 @@ Paper trading execution engine that simulates real order execution:
 
 import uuid
 import json
+import heapq
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from enum import Enum
 import pytz
 
@@ -35,7 +36,7 @@ class OrderType(Enum):
     STOP_LOSS = "STOP_LOSS"
 
 
-@dataclass
+@dataclass(slots=True)
 class VirtualOrder:
     """Virtual order for paper trading"""
     order_id: str
@@ -53,17 +54,24 @@ class VirtualOrder:
     
     def to_dict(self) -> Dict:
         """Convert order to dictionary for JSON serialization"""
-        data = asdict(self)
-        data['signal_type'] = self.signal_type.value
-        data['order_type'] = self.order_type.value
-        data['status'] = self.status.value
-        data['timestamp'] = self.timestamp.isoformat()
-        if self.filled_timestamp:
-            data['filled_timestamp'] = self.filled_timestamp.isoformat()
-        return data
+        # Built explicitly - asdict() would deep-copy metadata only to have the enum fields overwritten
+        return {
+            'order_id': self.order_id,
+            'symbol': self.symbol,
+            'signal_type': self.signal_type.value,
+            'quantity': self.quantity,
+            'order_type': self.order_type.value,
+            'price': self.price,
+            'status': self.status.value,
+            'timestamp': self.timestamp.isoformat(),
+            'filled_quantity': self.filled_quantity,
+            'filled_price': self.filled_price,
+            'filled_timestamp': self.filled_timestamp.isoformat() if self.filled_timestamp else None,
+            'metadata': dict(self.metadata) if self.metadata is not None else None
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class VirtualTrade:
     """Record of executed trade"""
     trade_id: str
@@ -78,10 +86,17 @@ class VirtualTrade:
     
     def to_dict(self) -> Dict:
         """Convert trade to dictionary"""
-        data = asdict(self)
-        data['signal_type'] = self.signal_type.value
-        data['timestamp'] = self.timestamp.isoformat()
-        return data
+        return {
+            'trade_id': self.trade_id,
+            'order_id': self.order_id,
+            'symbol': self.symbol,
+            'signal_type': self.signal_type.value,
+            'quantity': self.quantity,
+            'price': self.price,
+            'timestamp': self.timestamp.isoformat(),
+            'fees': self.fees,
+            'metadata': dict(self.metadata) if self.metadata is not None else None
+        }
 
 
 class VirtualOrderExecutor:
@@ -994,10 +1009,10 @@ class VirtualOrderExecutor:
     def get_order_history(self, limit: int = 50) -> List[Dict]:
         """Get recent order history"""
         try:
-            orders = list(self.orders.values())
-            orders.sort(key=lambda x: x.timestamp, reverse=True)
+            # Select only the newest `limit` entries instead of sorting the whole history
+            orders = heapq.nlargest(limit, self.orders.values(), key=lambda x: x.timestamp)
             
-            return [order.to_dict() for order in orders[:limit]]
+            return [order.to_dict() for order in orders]
             
         except Exception as e:
             print(f"Error getting order history: {e}")
@@ -1006,10 +1021,10 @@ class VirtualOrderExecutor:
     def get_trade_history(self, limit: int = 50) -> List[Dict]:
         """Get recent trade history"""
         try:
-            trades = list(self.trades.values())
-            trades.sort(key=lambda x: x.timestamp, reverse=True)
+            # Select only the newest `limit` entries instead of sorting the whole history
+            trades = heapq.nlargest(limit, self.trades.values(), key=lambda x: x.timestamp)
             
-            return [trade.to_dict() for trade in trades[:limit]]
+            return [trade.to_dict() for trade in trades]
             
         except Exception as e:
             print(f"Error getting trade history: {e}")
@@ -18,11 +18,19 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
-import os
+import re
 
 from .base_strategy import BaseStrategy, TradingSignal, SignalType, Position
 
 
+# Strike patterns for option symbols, compiled once at import instead of per SELL signal
+STRIKE_PATTERN = re.compile(r'(\d{5})(CE|PE)$')           # Standard 5-digit Nifty strike
+STRIKE_FALLBACK_PATTERN = re.compile(r'(\d{4,6})(CE|PE)$')  # 4-6 digit fallback
+
+# Columns update_market_data expects in each 1-minute OHLCV frame
+REQUIRED_OHLCV_COLUMNS = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+
+
 def get_weekly_expiry_date(current_date: datetime) -> datetime:
     """
     Calculate the correct weekly expiry date for NIFTY options.
@@ -55,7 +63,7 @@ def get_weekly_expiry_date(current_date: datetime) -> datetime:
     return expiry_date
 
 
-@dataclass  
+@dataclass(slots=True)
 class ScalpingConfig:
     """Configuration parameters for supertrend scalping strategy"""
     rsi_period: int = 3          # ATR period for Supertrend
@@ -116,8 +124,8 @@ class ScalpingStrategy(BaseStrategy):
     def _load_config_from_db(self) -> ScalpingConfig:
         """Load strategy configuration from database"""
         try:
-            from core.database_manager import DatabaseManager
-            db_manager = DatabaseManager()
+            from core.database_manager import get_database_manager
+            db_manager = get_database_manager()
             
             result = db_manager.supabase.table('scalping_strategy_config').select('*').eq('id', 1).execute()
             
@@ -160,8 +168,8 @@ class ScalpingStrategy(BaseStrategy):
             print(f"✅ Updated in-memory config: profit={self.strategy_config.target_profit}%, stop={self.strategy_config.stop_loss}%, strike_offset={self.strategy_config.strike_offset}")
             
             # Update database (async)
-            from core.database_manager import DatabaseManager
-            db_manager = DatabaseManager()
+            from core.database_manager import get_database_manager
+            db_manager = get_database_manager()
             
             update_data = {
                 'profit_target': self.strategy_config.target_profit,
@@ -197,22 +205,23 @@ class ScalpingStrategy(BaseStrategy):
         """
         try:
             # Ensure we have required columns
-            required_cols = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
-            if not all(col in ohlcv_data.columns for col in required_cols):
-                raise ValueError(f"Missing required columns. Expected: {required_cols}")
+            if not all(col in ohlcv_data.columns for col in REQUIRED_OHLCV_COLUMNS):
+                raise ValueError(f"Missing required columns. Expected: {list(REQUIRED_OHLCV_COLUMNS)}")
             
             # CRITICAL FIX: Remove last candle (incomplete/live data from Kite API)
             # Kite returns current candle with live price as 'close' - we need CLOSED candles only
+            # The slice is a view - it is only copied below once we know there is something to buffer
             if len(ohlcv_data) > 1:
-                closed_candles = ohlcv_data.iloc[:-1].copy()
+                closed_candles = ohlcv_data.iloc[:-1]
             else:
                 # If only 1 candle, can't exclude it - return early
                 return
             
             # Check if we have new candle data (different from last processed)
             if len(self.data_buffer) > 0 and len(closed_candles) > 0:
-                last_buffered_timestamp = self.data_buffer.iloc[-1]['timestamp']
-                last_new_timestamp = closed_candles.iloc[-1]['timestamp']
+                # Read scalar timestamps directly rather than materialising whole rows
+                last_buffered_timestamp = self.data_buffer['timestamp'].iat[-1]
+                last_new_timestamp = closed_candles['timestamp'].iat[-1]
                 
                 # Only process if we have genuinely NEW closed candle
                 if last_new_timestamp <= last_buffered_timestamp:
@@ -247,11 +256,10 @@ class ScalpingStrategy(BaseStrategy):
         """Update 5-minute data and calculate Higher Timeframe trend for confirmation."""
         try:
             if len(ohlcv_data) > 1:
-                closed_candles = ohlcv_data.copy()  # Include live forming candle to match Kite screen
-                
-                # Keep only last 100 candles for memory efficiency
-                if len(closed_candles) > 100:
-                    closed_candles = closed_candles.tail(100).reset_index(drop=True)
+                # Include live forming candle to match Kite screen
+                # Keep only last 100 candles for memory efficiency. This is a read-only
+                # view - indicators are kept in local arrays, so the frame is never copied
+                closed_candles = ohlcv_data.tail(100)
                 
                 atr_period = self.strategy_config.rsi_period
                 atr_multiplier = self.strategy_config.rsi_oversold
@@ -266,23 +274,26 @@ class ScalpingStrategy(BaseStrategy):
                 tr1 = high - low
                 tr2 = (high - close_prev).abs()
                 tr3 = (low - close_prev).abs()
-                true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-                closed_candles['atr'] = true_range.rolling(atr_period).mean()
+                true_range = np.fmax(np.fmax(tr1, tr2), tr3)  # NaN-skipping like max(axis=1)
+                atr = true_range.rolling(atr_period).mean()
 
                 # Basic bands
                 hl2 = (high + low) / 2
-                closed_candles['basic_upper'] = hl2 + (atr_multiplier * closed_candles['atr'])
-                closed_candles['basic_lower'] = hl2 - (atr_multiplier * closed_candles['atr'])
+                basic_upper = (hl2 + (atr_multiplier * atr)).to_numpy()
+                basic_lower = (hl2 - (atr_multiplier * atr)).to_numpy()
 
-                # Final bands
+                # Final bands and trend in a single pass over the candles
+                # (iterate numpy arrays rather than scalar .loc lookups)
+                closes = closed_candles['close'].to_numpy()
                 final_upper = [0.0] * len(closed_candles)
                 final_lower = [0.0] * len(closed_candles)
+                trend = ['neutral'] * len(closed_candles)
                 
                 for i in range(1, len(closed_candles)):
                     # Upper
-                    bu = closed_candles.loc[i, 'basic_upper']
+                    bu = basic_upper[i]
                     prev_fu = final_upper[i-1]
-                    prev_c = closed_candles.loc[i-1, 'close']
+                    prev_c = closes[i-1]
                     
                     if (bu < prev_fu or prev_c > prev_fu):
                         final_upper[i] = bu if pd.notna(bu) else prev_fu
@@ -290,18 +301,16 @@ class ScalpingStrategy(BaseStrategy):
                         final_upper[i] = prev_fu
                         
                     # Lower
-                    bl = closed_candles.loc[i, 'basic_lower']
+                    bl = basic_lower[i]
                     prev_fl = final_lower[i-1]
                     
                     if (bl > prev_fl or prev_c < prev_fl):
                         final_lower[i] = bl if pd.notna(bl) else prev_fl
                     else:
                         final_lower[i] = prev_fl
-                        
-                # Determine trend continuously
-                trend = ['neutral'] * len(closed_candles)
-                for i in range(1, len(closed_candles)):
-                    curr_c = closed_candles.loc[i, 'close']
+                    
+                    # Determine trend continuously (depends only on this candle's final bands)
+                    curr_c = closes[i]
                     prev_t = trend[i-1]
                     fu = final_upper[i]
                     fl = final_lower[i]
@@ -332,31 +341,38 @@ class ScalpingStrategy(BaseStrategy):
             # Calculate ATR
             self.data_buffer['atr'] = self._calculate_atr(atr_period)
             
-            # Calculate basic upper and lower bands
+            # Calculate basic upper and lower bands (only used to derive the final
+            # bands, so kept as local arrays rather than inserted into the buffer)
             hl2 = (self.data_buffer['high'] + self.data_buffer['low']) / 2
-            self.data_buffer['basic_upper'] = hl2 + (atr_multiplier * self.data_buffer['atr'])
-            self.data_buffer['basic_lower'] = hl2 - (atr_multiplier * self.data_buffer['atr'])
+            basic_upper = (hl2 + (atr_multiplier * self.data_buffer['atr'])).to_numpy()
+            basic_lower = (hl2 - (atr_multiplier * self.data_buffer['atr'])).to_numpy()
             
-            # Calculate final upper and lower bands
-            self.data_buffer['final_upper'] = 0.0
-            self.data_buffer['final_lower'] = 0.0
+            # Calculate final upper and lower bands (built as lists and assigned once -
+            # per-row .loc writes go through the pandas indexer on every iteration)
+            # Loop over plain numpy arrays - scalar .loc lookups dominate the cost otherwise
+            closes = self.data_buffer['close'].to_numpy()
+            final_upper = [0.0] * len(self.data_buffer)
+            final_lower = [0.0] * len(self.data_buffer)
             
             for i in range(1, len(self.data_buffer)):
+                prev_close = closes[i-1]
+                
                 # Final Upper Band – do not propagate nan (ATR is nan for first few rows)
-                if (self.data_buffer.loc[i, 'basic_upper'] < self.data_buffer.loc[i-1, 'final_upper'] or 
-                    self.data_buffer.loc[i-1, 'close'] > self.data_buffer.loc[i-1, 'final_upper']):
-                    bu = self.data_buffer.loc[i, 'basic_upper']
-                    self.data_buffer.loc[i, 'final_upper'] = bu if pd.notna(bu) else self.data_buffer.loc[i-1, 'final_upper']
+                bu = basic_upper[i]
+                if bu < final_upper[i-1] or prev_close > final_upper[i-1]:
+                    final_upper[i] = bu if pd.notna(bu) else final_upper[i-1]
                 else:
-                    self.data_buffer.loc[i, 'final_upper'] = self.data_buffer.loc[i-1, 'final_upper']
+                    final_upper[i] = final_upper[i-1]
                 
                 # Final Lower Band – do not propagate nan
-                if (self.data_buffer.loc[i, 'basic_lower'] > self.data_buffer.loc[i-1, 'final_lower'] or 
-                    self.data_buffer.loc[i-1, 'close'] < self.data_buffer.loc[i-1, 'final_lower']):
-                    bl = self.data_buffer.loc[i, 'basic_lower']
-                    self.data_buffer.loc[i, 'final_lower'] = bl if pd.notna(bl) else self.data_buffer.loc[i-1, 'final_lower']
+                bl = basic_lower[i]
+                if bl > final_lower[i-1] or prev_close < final_lower[i-1]:
+                    final_lower[i] = bl if pd.notna(bl) else final_lower[i-1]
                 else:
-                    self.data_buffer.loc[i, 'final_lower'] = self.data_buffer.loc[i-1, 'final_lower']
+                    final_lower[i] = final_lower[i-1]
+            
+            self.data_buffer['final_upper'] = final_upper
+            self.data_buffer['final_lower'] = final_lower
             
             # Determine Supertrend line and direction
             self.data_buffer['supertrend'] = 0.0
@@ -428,13 +444,13 @@ class ScalpingStrategy(BaseStrategy):
                 # First initialization - wait for trend to be established
                 self.current_trend = new_trend
                 self.last_trend = new_trend
-                candle_time = self.data_buffer.iloc[-1]['timestamp']
+                candle_time = self.data_buffer['timestamp'].iat[-1]
                 print(f"🔵 Initial trend established: {new_trend} at {candle_time}")
                 return
             
             # Check if trend changed in this new candle
             if new_trend != self.current_trend:
-                candle_time = self.data_buffer.iloc[-1]['timestamp']
+                candle_time = self.data_buffer['timestamp'].iat[-1]
                 u_str = f"{final_upper:.2f}" if pd.notna(final_upper) else "nan"
                 l_str = f"{final_lower:.2f}" if pd.notna(final_lower) else "nan"
                 print(f"✅ Trend change CONFIRMED: {self.current_trend} → {new_trend}")
@@ -464,7 +480,9 @@ class ScalpingStrategy(BaseStrategy):
         tr2 = (high - close_prev).abs()
         tr3 = (low - close_prev).abs()
         
-        true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+        # Element-wise max instead of concatenating into a temporary frame;
+        # fmax ignores the NaN previous close on the first row like max(axis=1) does
+        true_range = np.fmax(np.fmax(tr1, tr2), tr3)
         atr = true_range.rolling(period).mean()
         
         return atr
@@ -508,8 +526,6 @@ class ScalpingStrategy(BaseStrategy):
         self._new_candle_arrived = False
         
         try:
-            latest = self.data_buffer.iloc[-1]
-            
             # Check for Supertrend trend change (reversal detection)
             trend_changed = self.current_trend != self.last_trend
             
@@ -525,6 +541,10 @@ class ScalpingStrategy(BaseStrategy):
             
             print(f"✅ Confirmed trend change at candle boundary: {self.last_trend} → {self.current_trend}")
             
+            # Read the latest indicator values once the cheap trend/cooldown checks pass
+            latest_supertrend = self._latest_value('supertrend', 0)
+            latest_atr = self._latest_value('atr', 0)
+            
             # BUY_CALL Signal: Trend changed from bearish to bullish
             if self.last_trend == 'bearish' and self.current_trend == 'bullish':
                 # HTF 5-Min Confirmation Check
@@ -572,8 +592,8 @@ class ScalpingStrategy(BaseStrategy):
                         metadata={
                             'strategy': 'supertrend_scalping',
                             'trend_change': f'{self.last_trend} → {self.current_trend}',
-                            'supertrend_level': latest.get('supertrend', 0),
-                            'atr': latest.get('atr', 0),
+                            'supertrend_level': latest_supertrend,
+                            'atr': latest_atr,
                             'signal_reason': 'Bullish trend reversal (OTM Call)'
                         }
                     )
@@ -631,8 +651,8 @@ class ScalpingStrategy(BaseStrategy):
                         metadata={
                             'strategy': 'supertrend_scalping',
                             'trend_change': f'{self.last_trend} → {self.current_trend}',
-                            'supertrend_level': latest.get('supertrend', 0),
-                            'atr': latest.get('atr', 0),
+                            'supertrend_level': latest_supertrend,
+                            'atr': latest_atr,
                             'signal_reason': 'Bearish trend reversal (OTM Put)',
                             'underlying_price': current_price
                         }
@@ -981,15 +1001,14 @@ class ScalpingStrategy(BaseStrategy):
         try:
             # Pattern: Extract last 5 digits before CE/PE
             # NIFTY25D16[25850]CE or NIFTY251220[25800]PE
-            import re
             
             # Match exactly 5 digits before CE/PE (standard Nifty strike format)
-            match = re.search(r'(\d{5})(CE|PE)$', symbol)
+            match = STRIKE_PATTERN.search(symbol)
             if match:
                 return int(match.group(1))
             
             # Fallback: Match 4-6 digits before CE/PE
-            match = re.search(r'(\d{4,6})(CE|PE)$', symbol)
+            match = STRIKE_FALLBACK_PATTERN.search(symbol)
             if match:
                 return int(match.group(1))
                 
@@ -998,15 +1017,20 @@ class ScalpingStrategy(BaseStrategy):
         
         return 0  # Return 0 if extraction fails
     
+    def _latest_value(self, column: str, default: Any = None) -> Any:
+        """Latest buffered value of one column, without building the whole last row as a Series"""
+        if self.data_buffer.empty or column not in self.data_buffer.columns:
+            return default
+        return self.data_buffer[column].iat[-1]
+    
     def get_strategy_stats(self) -> Dict:
         """Return current strategy statistics"""
-        latest_data = self.data_buffer.iloc[-1] if not self.data_buffer.empty else {}
         return {
             'strategy_name': self.name,
             'data_points': len(self.data_buffer),
             'current_trend': self.current_trend,
             'last_trend_change': f"{self.last_trend} → {self.current_trend}" if self.last_trend and self.current_trend else None,
-            'current_atr': latest_data.get('atr', None),
-            'supertrend_level': latest_data.get('supertrend', None),
+            'current_atr': self._latest_value('atr'),
+            'supertrend_level': self._latest_value('supertrend'),
             'parameters': self.get_strategy_parameters()
         }
\ No newline at end of file
@@ -820,8 +820,8 @@ def api_live_positions():
 def get_scalping_config():
     """Get current scalping strategy configuration"""
     try:
-        from core.database_manager import DatabaseManager
-        db_manager = DatabaseManager()
+        from core.database_manager import get_database_manager
+        db_manager = get_database_manager()
         
         result = db_manager.supabase.table('scalping_strategy_config').select('*').eq('id', 1).execute()
         
@@ -877,8 +877,8 @@ def update_scalping_config():
             return jsonify({'success': False, 'error': 'strike_offset must be an integer between -3 and 3'}), 400
         
         # Update database
-        from core.database_manager import DatabaseManager
-        db_manager = DatabaseManager()
+        from core.database_manager import get_database_manager
+        db_manager = get_database_manager()
         
         update_data = {}
         if profit_target is not None:
@@ -1148,11 +1148,11 @@ def api_positions():
     """Get current day positions (both open and closed) from database"""
     try:
         # Use direct database connection instead of relying on trading_manager
-        from core.database_manager import DatabaseManager
+        from core.database_manager import get_database_manager
         from datetime import datetime, timezone
         import pytz
         
-        db_manager = DatabaseManager()
+        db_manager = get_database_manager()
         
         if not db_manager:
             return jsonify({
@@ -1221,11 +1221,11 @@ def api_positions():
 def api_dashboard_metrics():
     """Get dashboard metrics including margin and balance information"""
     try:
-        from core.database_manager import DatabaseManager
+        from core.database_manager import get_database_manager
         from datetime import datetime, timezone
         import pytz
         
-        db_manager = DatabaseManager()
+        db_manager = get_database_manager()
         
         if not db_manager:
             return jsonify({
@@ -1293,8 +1293,8 @@ def api_orders():
         limit = int(request.args.get('limit', 100))  # Increased for frequent trading
         
         # Use direct database connection instead of relying on trading_manager
-        from core.database_manager import DatabaseManager
-        db_manager = DatabaseManager()
+        from core.database_manager import get_database_manager
+        db_manager = get_database_manager()
         
         if not db_manager:
             return jsonify({
@@ -1351,10 +1351,10 @@ def api_order_integrity():
     """Check order integrity - verify BUY and SELL orders are properly saved"""
     try:
         from core.virtual_order_executor import VirtualOrderExecutor
-        from core.database_manager import DatabaseManager
+        from core.database_manager import get_database_manager
         from config.settings import TradingConfig
         
-        db_manager = DatabaseManager()
+        db_manager = get_database_manager()
         executor = VirtualOrderExecutor(initial_capital=TradingConfig.PAPER_TRADING_CAPITAL, db_manager=db_manager)
         
         integrity_result = executor.verify_order_integrity()